@@ -4,28 +4,47 @@ from functools import partial
 import numpy as np
 from IPython.display import display
 from pydantic.dataclasses import dataclass
-from scipy import interpolate
+from scipy.integrate import cumulative_trapezoid
 from sympy import integrate, lambdify, oo, symbols
 
+CDF_GRID_CACHE_SIZE = 8
+RNG = np.random.default_rng()
+
+
+def set_seed(seed: int = None):
+    """Reseed the random generator shared by all distributions."""
+    RNG.bit_generator.state = np.random.PCG64(seed).state
+
 
 @dataclass
 class BaseDistribution:
     """Base distribution class."""
 
-    def __init__(self, dist_parameters):
+    def __init__(self, dist_parameters, seed: int = None):
         """Post init section.
 
         This built-in method is calle when the BaseDistribution class
         is instantiated. This function creates a self._pdf `partial` function
-        which allows you to partially initialize a function.
+        which allows you to partially initialize a function. Samples are
+        drawn from the shared module generator unless a `seed` is given.
         """
         self._pdf = partial(self.distribution, **dist_parameters)
+        self._cdf_grid_cache = {}
+        self.rng = RNG if seed is None else np.random.default_rng(seed)
 
-    def __compute_pdf_norm(self, x: np.array):
-        """Compute PDF norm."""
-        self.norm_factor = (x.max() - x.min()) / len(x)
+    def __compute_pdf_norm(
+        self, x: np.array, x_min: float = None, x_max: float = None
+    ):
+        """Compute PDF norm.
+
+        If the limits of `x` are known they can be passed in to skip the
+        min/max reductions over the whole array.
+        """
+        if x_min is None or x_max is None:
+            x_min, x_max = x.min(), x.max()
+        self.norm_factor = (x_max - x_min) / len(x)
         if not hasattr(self, "norm"):
-            self.norm = 1.0 / np.sum(self._pdf(x) * self.norm_factor)
+            self.norm = 1.0 / (np.sum(self._pdf(x)) * self.norm_factor)
 
     def cdf(self, x: np.array):
         """Cumulative Distribution Function."""
@@ -66,16 +85,28 @@ class BaseDistribution:
         self.__compute_pdf_norm(x)
         return self._pdf(x) * self.norm
 
-    def random_sample(self, x_min: float, x_max: float, size: int):
-        """Random sample distribution."""
-        x = np.linspace(x_min, x_max, 10_000)
-        cdf = self.cdf(x)
+    def __cdf_grid(self, x_min: float, x_max: float, grid_size: int):
+        """CDF tabulated on the sampling grid.
 
-        cdf_inv = interpolate.interp1d(cdf, x, fill_value="extrapolate")
+        Integrated with the trapezoidal rule from 0 at `x_min` to 1 at `x_max`,
+        so its inverse covers the whole unit interval. The last
+        `CDF_GRID_CACHE_SIZE` grids are kept, least recently used evicted first.
+        """
+        key = (x_min, x_max, grid_size)
+        if key in self._cdf_grid_cache:
+            self._cdf_grid_cache[key] = self._cdf_grid_cache.pop(key)
+            return self._cdf_grid_cache[key]
 
-        try:
-            x_new = np.random.uniform(0.0001, 0.9999, size=size)
-            return cdf_inv(x_new)
-        except ValueError:
-            x_new = np.random.uniform(0.001, 0.999, size=size)
-            return cdf_inv(x_new)
+        if len(self._cdf_grid_cache) >= CDF_GRID_CACHE_SIZE:
+            del self._cdf_grid_cache[next(iter(self._cdf_grid_cache))]
+        x = np.linspace(x_min, x_max, grid_size)
+        self.__compute_pdf_norm(x, x_min, x_max)
+        cdf = cumulative_trapezoid(self._pdf(x), x, initial=0)
+        self._cdf_grid_cache[key] = (cdf / cdf[-1], x)
+        return self._cdf_grid_cache[key]
+
+    def random_sample(self, x_min: float, x_max: float, size: int):
+        """Random sample distribution."""
+        cdf, x = self.__cdf_grid(x_min, x_max, 10_000)
+        x_new = self.rng.uniform(size=size)
+        return np.interp(x_new, cdf, x)
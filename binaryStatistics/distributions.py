@@ -13,26 +13,69 @@ class Uniform(BaseDistribution):
     """Uniform distribution class."""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
-        """Init BaseDistribution."""
-        super().__init__(self.dist_parameters)
+        """Init BaseDistribution.
+
+        The limits are bound once: `distribution` and `self._pdf` are replaced
+        by a normalized density specialized for [a, b].
+        """
+        super().__init__(self.dist_parameters, self.seed)
+        a, b = self.dist_parameters.get("a"), self.dist_parameters.get("b")
+        self.norm = 1 if a is None or b is None else 1 / (b - a)
+        self.distribution = self._pdf = self._bind_distribution(a, b)
+
+    @staticmethod
+    def _evaluate(x, a=None, b=None):
+        """Normalized density for arbitrary limits."""
+        if a is None or b is None:
+            return np.ones_like(x) if isinstance(x, np.ndarray) else 1
+        norm = 1 / (b - a)
+        if isinstance(x, np.ndarray):
+            return np.where((x >= a) & (x <= b), norm, 0.0)
+        if isinstance(x, Symbol):
+            return Piecewise((0, x < a), (0, x > b), (norm, True))
+        return norm if a <= x <= b else 0.0
+
+    @staticmethod
+    def _bind_distribution(lower=None, upper=None):
+        """Build the normalized density specialized for fixed limits."""
+        evaluate = Uniform._evaluate
+
+        if lower is None or upper is None:
+
+            def _unbounded(x, a=None, b=None):
+                """Unbounded distribution."""
+                if a is not None or b is not None:
+                    return evaluate(x, a, b)
+                return np.ones_like(x) if isinstance(x, np.ndarray) else 1
+
+            return _unbounded
+
+        norm = 1 / (upper - lower)
+
+        def _bounded(x, a=lower, b=upper):
+            """Distribution for the bound limits."""
+            if a != lower or b != upper:
+                return evaluate(x, a, b)
+            if isinstance(x, float):
+                return norm if lower <= x <= upper else 0.0
+            if isinstance(x, np.ndarray):
+                return np.where((x >= lower) & (x <= upper), norm, 0.0)
+            if isinstance(x, Symbol):
+                return Piecewise((0, x < lower), (0, x > upper), (norm, True))
+            return norm if lower <= x <= upper else 0.0
+
+        return _bounded
 
     def distribution(self, x, a=None, b=None):
         """Distribution method."""
-        if a and b:
-            self.norm = 1 / (b - a)
-            if isinstance(x, Symbol):
-                return Piecewise((0, x < a), (0, x > b), (1 * self.norm, True))
-            if isinstance(x, int | float):
-                return 1 * self.norm if a <= x <= b else 0.0
-            if isinstance(x, np.ndarray):
-                return np.piecewise(
-                    x, [(x < a), (x <= b) * (x >= a)], [0, 1 * self.norm]
-                )
-        else:
-            self.norm = 1
-            return np.ones_like(x) if isinstance(x, np.ndarray) else 1
+        return self._evaluate(x, a, b)
+
+    def pdf(self, x):
+        """Probability Distribution Function."""
+        return self._pdf(x)
 
 
 @dataclass
@@ -40,10 +83,11 @@ class Thermal(BaseDistribution):
     """Thermal distribution class."""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Init BaseDistribution."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, x):
         """Distribution method."""
@@ -55,15 +99,26 @@ class PowerLaw(BaseDistribution):
     """Power law distribution class."""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Init BaseDistribution."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, x, C, alpha):
         """Distribution method."""
         return C * x**alpha
 
+    def random_sample(self, x_min, x_max, size):
+        """Random sample from the analytical inverse CDF."""
+        alpha = self.dist_parameters["alpha"]
+        u = self.rng.uniform(size=size)
+        if alpha == -1:
+            return x_min * (x_max / x_min) ** u
+
+        k = 1.0 + alpha
+        return (u * (x_max**k - x_min**k) + x_min**k) ** (1.0 / k)
+
 
 @dataclass
 class Log(BaseDistribution):
@@ -71,10 +126,11 @@ class Log(BaseDistribution):
 
     alpha = -1
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Init BaseDistribution."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, x):
         """Distribution method."""
@@ -86,22 +142,25 @@ class VelTilde(BaseDistribution):
     """V-tilde distribution"""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Init section."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, phi, phi_0, i, e):
         """Distribution."""
-        temp2 = 1.0 - (np.sin(i) ** 2) * (np.cos(phi - phi_0) ** 2)
+        sin_i2 = np.sin(i) ** 2
+        delta_phi = phi - phi_0
+        e_cos_phi = e * np.cos(phi)
+
+        temp2 = 1.0 - sin_i2 * np.cos(delta_phi) ** 2
         temp2 = temp2**0.25
 
-        temp1 = e * np.sin(phi_0) - np.sin(phi - phi_0)
+        temp1 = e * np.sin(phi_0) - np.sin(delta_phi)
         temp1 = temp1 * temp1
 
-        temp3 = (1.0 + e * e + 2 * e * np.cos(phi) - np.sin(i) * np.sin(i) * temp1) / (
-            1.0 + e * np.cos(phi)
-        )
+        temp3 = (1.0 + e * e + 2 * e_cos_phi - sin_i2 * temp1) / (1.0 + e_cos_phi)
         temp3 = np.sqrt(temp3)
 
         return temp2 * temp3
@@ -112,10 +171,11 @@ class PhiAngle(BaseDistribution):
     """Phi angle distribution."""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Init section."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, phi, e):
         """Distribution."""
@@ -125,19 +185,19 @@ class PhiAngle(BaseDistribution):
 
     def random_sample(self, x_min, x_max, size):
         """Random sample."""
-        phi_ = []
-        e = self.dist_parameters["e"]
-        for index in range(size):
-            LI = 0
-            while LI < 1:
-                E = e[index]
-                c = (1 - E**2) / (2 * np.pi * (1 - E) ** 2)
-                base = x_max - x_min
-                Phi = np.random.uniform() * base
-                pPhi = np.random.uniform() * c
-                if pPhi <= self.distribution(Phi, E):
-                    LI = 2
-                    phi_.append(Phi)
+        e = np.asarray(self.dist_parameters["e"], dtype=float)
+        e = e[:size] if e.ndim else np.full(size, e)
+        c = (1 - e**2) / (2 * np.pi * (1 - e) ** 2)
+        base = x_max - x_min
+
+        phi_ = np.empty(size)
+        pending = np.arange(size)
+        while pending.size:
+            Phi = self.rng.uniform(size=pending.size) * base
+            pPhi = self.rng.uniform(size=pending.size) * c[pending]
+            accepted = pPhi <= self.distribution(Phi, e[pending])
+            phi_[pending[accepted]] = Phi[accepted]
+            pending = pending[~accepted]
         return phi_
 
 
@@ -146,10 +206,11 @@ class Sine(BaseDistribution):
     """Sine distribution."""
 
     dist_parameters: dict = Field(default={})
+    seed: int = None
 
     def __post_init_post_parse__(self):
         """Initialize."""
-        super().__init__(self.dist_parameters)
+        super().__init__(self.dist_parameters, self.seed)
 
     def distribution(self, i):
         """Distribution."""
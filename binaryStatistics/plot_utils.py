@@ -1,4 +1,7 @@
 """Plot utilities."""
+from functools import lru_cache
+from math import gcd
+
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -52,19 +55,14 @@ def plot_histogram(
 
 def multiple_formatter(denominator=8, number=np.pi, latex="\\pi"):
     """Multiple formatter."""
+    scale = denominator / number
 
-    def gcd(a, b):
-        """GCD"""
-        while b:
-            a, b = b, a % b
-        return a
-
-    def _multiple_formatter(x, pos):
-        """Multiple formatter."""
+    @lru_cache(maxsize=None)
+    def _multiple_label(num):
+        """Label for num / denominator multiples."""
         den = denominator
-        num = int(np.rint(den * x / number))
         com = gcd(num, den)
-        (num, den) = (int(num / com), int(den / com))
+        (num, den) = (num // com, den // com)
         if den == 1:
             if num == 0:
                 return r"$0$"
@@ -82,6 +80,10 @@ def multiple_formatter(denominator=8, number=np.pi, latex="\\pi"):
             else:
                 return r"$\frac{%s%s}{%s}$" % (num, latex, den)
 
+    def _multiple_formatter(x, pos):
+        """Multiple formatter."""
+        return _multiple_label(int(np.rint(x * scale)))
+
     return _multiple_formatter
 
 